@@ -1,15 +1,19 @@
 """Script principal para ejecutar el scraper de CodeIA."""
 
+import argparse
 import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Agregar src al path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.scraper_precios import PreciosScraper
 from src.scraper_lecciones import LeccionesScraper
+from src.checkpoint import Checkpoint
+from src.profiling import Profiler, etapa
 from src.utils import (
     create_output_directories,
     save_to_json,
@@ -30,8 +34,80 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Procesa los argumentos de línea de comandos.
+
+    Args:
+        argv: Lista de argumentos (por defecto, sys.argv)
+
+    Returns:
+        Namespace con las opciones
+    """
+    parser = argparse.ArgumentParser(description="Scraper de codeia.dev")
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help="Reanuda desde el último checkpoint, saltando el trabajo ya completado"
+    )
+    parser.add_argument(
+        '--extraccion',
+        choices=['dom', 'red'],
+        default='dom',
+        help="Origen de los datos: HTML renderizado (dom) o respuestas de red del sitio (red, con el HTML como respaldo)"
+    )
+    parser.add_argument(
+        '--base-url',
+        default='https://codeia.dev',
+        help="URL base del sitio (p. ej. un servidor local de pruebas)"
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help="Perfila CPU y memoria por etapas y guarda los resultados en output/"
+    )
+    return parser.parse_args(argv)
+
+
+def scrape_stage(checkpoint: Checkpoint, nombre: str, scrape_fn,
+                 profiler: Optional[Profiler] = None) -> tuple:
+    """
+    Ejecuta una etapa de scraping o la recupera del checkpoint.
+
+    La etapa solo se registra como completada si no hubo un error fatal
+    (p. ej. Chrome caído) ni descargas fallidas, para que --resume la
+    vuelva a intentar.
+
+    Args:
+        checkpoint: Diario de checkpoints
+        nombre: Nombre de la etapa
+        scrape_fn: Función sin argumentos que retorna (datos, errores)
+        profiler: Perfilador donde registrar la escritura del checkpoint
+
+    Returns:
+        Tupla con (datos_extraídos, errores)
+    """
+    completada = checkpoint.etapa_completada(nombre)
+    if completada:
+        logger.info(f"Etapa '{nombre}' recuperada del checkpoint")
+        return completada['datos'], completada['errores']
+
+    data, errors = scrape_fn()
+    reintentable = any(
+        error.get('tipo') == f'scraping_{nombre}' or error.get('success') is False
+        for error in errors
+    )
+    if not reintentable:
+        with etapa(profiler, 'escritura'):
+            checkpoint.marcar_etapa(nombre, data, errors)
+
+    return data, errors
+
+
+def main(argv=None):
     """Función principal del scraper."""
+    args = parse_args(argv)
+
     logger.info("=" * 60)
     logger.info("INICIANDO SCRAPER DE CODEIA.DEV")
     logger.info("=" * 60)
@@ -40,66 +116,120 @@ def main():
     paths = create_output_directories()
     logger.info(f"Directorios de salida creados en: {paths['base']}")
 
+    # Diario de checkpoints para poder reanudar tras una interrupción
+    checkpoint = Checkpoint(
+        paths['base'] / 'checkpoint.jsonl',
+        resume=args.resume,
+        opciones={'base_url': args.base_url.rstrip('/'), 'extraccion': args.extraccion}
+    )
+
+    # Perfilador opcional de CPU y memoria
+    profiler = Profiler() if args.profile else None
+    if profiler:
+        profiler.start()
+
+    try:
+        result = run(paths, checkpoint, args, profiler)
+    finally:
+        checkpoint.close()
+        if profiler:
+            profiler.stop(paths['base'])
+
+    # Conservar el diario si alguna etapa falló, para poder reintentarla
+    if checkpoint.etapa_completada('precios') and checkpoint.etapa_completada('lecciones'):
+        checkpoint.clear()
+    else:
+        logger.warning(
+            f"Hay etapas incompletas; el checkpoint se conserva en {checkpoint.filepath}. "
+            "Ejecuta con --resume para continuar"
+        )
+
+    return result
+
+
+def run(paths: dict, checkpoint: Checkpoint, args: argparse.Namespace,
+        profiler: Optional[Profiler] = None) -> int:
+    """
+    Ejecuta el scraping completo y guarda los resultados.
+
+    Args:
+        paths: Directorios de salida
+        checkpoint: Diario de checkpoints
+        args: Opciones de línea de comandos
+        profiler: Perfilador donde registrar las etapas
+
+    Returns:
+        Código de salida
+    """
     # Almacenar todos los errores
     all_errors = []
 
     # --- SCRAPING DE PRECIOS ---
     logger.info("\n--- Scraping de Precios ---")
-    precios_scraper = PreciosScraper()
-    precios_data, precios_errors = precios_scraper.scrape()
+    base_url = args.base_url.rstrip('/')
+    precios_scraper = PreciosScraper(f"{base_url}/precios", modo=args.extraccion, profiler=profiler)
+    precios_data, precios_errors = scrape_stage(checkpoint, 'precios', precios_scraper.scrape, profiler)
     all_errors.extend(precios_errors)
 
     if precios_data:
-        # Guardar precios en JSON
-        save_to_json(precios_data, paths['data'] / 'precios.json')
-
-        # Guardar precios en CSV
-        # Convertir lista de características a string para CSV
-        precios_csv = []
-        for plan in precios_data:
-            plan_csv = plan.copy()
-            if isinstance(plan_csv.get('caracteristicas'), list):
-                plan_csv['caracteristicas'] = ' | '.join(plan_csv['caracteristicas'])
-            precios_csv.append(plan_csv)
-
-        save_to_csv(precios_csv, paths['data'] / 'precios.csv')
+        with etapa(profiler, 'escritura'):
+            # Guardar precios en JSON
+            save_to_json(precios_data, paths['data'] / 'precios.json')
+
+            # Guardar precios en CSV
+            # Convertir lista de características a string para CSV
+            precios_csv = []
+            for plan in precios_data:
+                plan_csv = plan.copy()
+                if isinstance(plan_csv.get('caracteristicas'), list):
+                    plan_csv['caracteristicas'] = ' | '.join(plan_csv['caracteristicas'])
+                precios_csv.append(plan_csv)
+
+            save_to_csv(precios_csv, paths['data'] / 'precios.csv')
         logger.info(f"✓ {len(precios_data)} planes de precios extraídos")
     else:
         logger.warning("⚠ No se extrajeron datos de precios")
 
     # --- SCRAPING DE LECCIONES ---
     logger.info("\n--- Scraping de Lecciones ---")
-    lecciones_scraper = LeccionesScraper()
-    lecciones_data, lecciones_errors = lecciones_scraper.scrape(paths['images_lecciones'])
+    lecciones_scraper = LeccionesScraper(f"{base_url}/lecciones", modo=args.extraccion,
+                                         profiler=profiler)
+    lecciones_data, lecciones_errors = scrape_stage(
+        checkpoint, 'lecciones',
+        lambda: lecciones_scraper.scrape(paths['images_lecciones'], checkpoint),
+        profiler
+    )
     all_errors.extend(lecciones_errors)
 
     if lecciones_data:
-        # Guardar lecciones en JSON
-        save_to_json(lecciones_data, paths['data'] / 'lecciones.json')
-
-        # Guardar lecciones en CSV
-        # Convertir lista de etiquetas a string para CSV
-        lecciones_csv = []
-        for leccion in lecciones_data:
-            leccion_csv = leccion.copy()
-            if isinstance(leccion_csv.get('etiquetas'), list):
-                leccion_csv['etiquetas'] = ', '.join(leccion_csv['etiquetas'])
-            lecciones_csv.append(leccion_csv)
-
-        save_to_csv(lecciones_csv, paths['data'] / 'lecciones.csv')
+        with etapa(profiler, 'escritura'):
+            # Guardar lecciones en JSON
+            save_to_json(lecciones_data, paths['data'] / 'lecciones.json')
+
+            # Guardar lecciones en CSV
+            # Convertir lista de etiquetas a string para CSV
+            lecciones_csv = []
+            for leccion in lecciones_data:
+                leccion_csv = leccion.copy()
+                if isinstance(leccion_csv.get('etiquetas'), list):
+                    leccion_csv['etiquetas'] = ', '.join(leccion_csv['etiquetas'])
+                lecciones_csv.append(leccion_csv)
+
+            save_to_csv(lecciones_csv, paths['data'] / 'lecciones.csv')
         logger.info(f"✓ {len(lecciones_data)} lecciones extraídas")
     else:
         logger.warning("⚠ No se extrajeron datos de lecciones")
 
     # --- GENERAR INFORME ---
     logger.info("\n--- Generando Informe ---")
-    report = generate_report(precios_data, lecciones_data, all_errors)
-
-    # Guardar informe en archivo
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_path = paths['base'] / f'informe_{timestamp}.txt'
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(report)
+    with etapa(profiler, 'escritura'):
+        report = generate_report(precios_data, lecciones_data, all_errors)
+
+        # Guardar informe en archivo
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(report)
 
     logger.info(f"Informe guardado en: {report_path}")
 
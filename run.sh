@@ -6,7 +6,7 @@
 source venv/bin/activate
 
 # Ejecutar scraper
-python main.py
+python main.py "$@"
 
 # Desactivar entorno virtual
 deactivate
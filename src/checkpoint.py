@@ -0,0 +1,194 @@
+"""Diario de checkpoints para reanudar un scraping interrumpido."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """
+    Diario JSON Lines con el trabajo ya completado durante una ejecución.
+
+    Cada línea es una entrada independiente (etapa terminada, lección
+    extraída o imagen descargada), de modo que si el proceso muere a mitad
+    de escritura solo se pierde la última línea, que se ignora al cargar.
+    """
+
+    def __init__(self, filepath: Path, resume: bool = False, intervalo: int = 10,
+                 opciones: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el diario de checkpoints.
+
+        Args:
+            filepath: Ruta del archivo de diario
+            resume: Si es True, carga el diario existente; si no, lo reinicia
+            intervalo: Número de entradas entre sincronizaciones a disco
+            opciones: Opciones de la ejecución (URL base, modo de extracción...).
+                Un diario creado con otras opciones no se reanuda
+        """
+        self.filepath = Path(filepath)
+        self.intervalo = max(1, intervalo)
+        self.opciones = opciones or {}
+        self.etapas: Dict[str, Dict[str, Any]] = {}
+        # Solo el trabajo cargado de disco al inicio; lo registrado durante
+        # esta ejecución no se reutiliza para no alterar una ejecución normal
+        self.lecciones_previas: Dict[str, Dict[str, Any]] = {}
+        self.descargas_previas: Dict[str, str] = {}
+        self._pendientes = 0
+
+        cargado = resume and self._load()
+        if not cargado and self.filepath.exists():
+            self.filepath.unlink()
+
+        self._file = open(self.filepath, 'a', encoding='utf-8')
+
+        if not cargado:
+            self._write({'tipo': 'cabecera', 'opciones': self.opciones}, sync=True)
+        else:
+            # Cerrar una última línea truncada para no mezclarla con las nuevas
+            with open(self.filepath, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._file.write('\n')
+
+    def _load(self) -> bool:
+        """
+        Carga las entradas del diario existente, si lo hay.
+
+        Returns:
+            True si se cargó un diario compatible con las opciones actuales
+        """
+        if not self.filepath.exists():
+            logger.info("No hay checkpoint previo, se empieza desde cero")
+            return False
+
+        entradas = []
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entrada = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Línea {num} del checkpoint incompleta, se ignora")
+                    continue
+                entradas.append(entrada)
+
+        cabecera = entradas[0] if entradas and entradas[0].get('tipo') == 'cabecera' else {}
+        if cabecera.get('opciones') != self.opciones:
+            logger.warning(
+                f"El checkpoint se creó con otras opciones ({cabecera.get('opciones')}); "
+                "se descarta y se empieza desde cero"
+            )
+            return False
+
+        for entrada in entradas[1:]:
+            tipo = entrada.get('tipo')
+            if tipo == 'etapa':
+                self.etapas[entrada['nombre']] = entrada
+            elif tipo == 'leccion':
+                self.lecciones_previas[entrada['clave']] = entrada['datos']
+            elif tipo == 'descarga':
+                self.descargas_previas[entrada['url']] = entrada['filename']
+
+        logger.info(
+            f"Checkpoint cargado: {len(self.etapas)} etapas, "
+            f"{len(self.lecciones_previas)} lecciones, {len(self.descargas_previas)} descargas"
+        )
+        return True
+
+    def _write(self, entrada: Dict[str, Any], sync: bool = False) -> None:
+        """
+        Añade una entrada al diario.
+
+        Args:
+            entrada: Entrada a registrar
+            sync: Si es True, fuerza la sincronización a disco inmediatamente
+        """
+        self._file.write(json.dumps(entrada, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self._pendientes += 1
+
+        if sync or self._pendientes >= self.intervalo:
+            os.fsync(self._file.fileno())
+            self._pendientes = 0
+
+    def etapa_completada(self, nombre: str) -> Optional[Dict[str, Any]]:
+        """Retorna la entrada de una etapa ya terminada, o None."""
+        return self.etapas.get(nombre)
+
+    def marcar_etapa(self, nombre: str, datos: List[Dict[str, Any]],
+                     errores: List[Dict[str, str]]) -> None:
+        """
+        Registra una etapa completa con sus datos y errores.
+
+        Args:
+            nombre: Nombre de la etapa (p. ej. 'precios')
+            datos: Datos extraídos en la etapa
+            errores: Errores encontrados en la etapa
+        """
+        entrada = {'tipo': 'etapa', 'nombre': nombre, 'datos': datos, 'errores': errores}
+        self.etapas[nombre] = entrada
+        self._write(entrada, sync=True)
+
+    def leccion_completada(self, clave: str) -> Optional[Dict[str, Any]]:
+        """Retorna los datos de una lección extraída en una ejecución anterior, o None."""
+        return self.lecciones_previas.get(clave)
+
+    def marcar_leccion(self, clave: str, datos: Dict[str, Any]) -> None:
+        """
+        Registra una lección extraída.
+
+        Args:
+            clave: Identificador único de la lección
+            datos: Datos de la lección
+        """
+        self._write({'tipo': 'leccion', 'clave': clave, 'datos': datos})
+
+    def descarga_completada(self, url: str, output_path: Path) -> Optional[str]:
+        """
+        Retorna el nombre del archivo de una imagen descargada en una ejecución anterior.
+
+        Solo se considera completada si el archivo sigue existiendo en disco.
+
+        Args:
+            url: URL de la imagen
+            output_path: Directorio donde se guardó la imagen
+
+        Returns:
+            Nombre del archivo o None si hay que descargarla
+        """
+        filename = self.descargas_previas.get(url)
+        if filename and (Path(output_path) / filename).exists():
+            return filename
+        return None
+
+    def marcar_descarga(self, url: str, filename: str) -> None:
+        """
+        Registra una imagen descargada.
+
+        Args:
+            url: URL de la imagen
+            filename: Nombre del archivo guardado
+        """
+        self._write({'tipo': 'descarga', 'url': url, 'filename': filename})
+
+    def close(self) -> None:
+        """Sincroniza y cierra el diario."""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def clear(self) -> None:
+        """Cierra y elimina el diario tras una ejecución completada."""
+        self.close()
+        if self.filepath.exists():
+            self.filepath.unlink()
+        logger.info("Checkpoint eliminado tras completar la ejecución")
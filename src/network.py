@@ -0,0 +1,343 @@
+"""Extracción de datos a partir de las respuestas de red capturadas por Selenium."""
+
+import base64
+import json
+import logging
+import re
+from typing import List, Dict, Any, Callable, Optional
+from urllib.parse import urljoin, urlparse
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+# Tipos MIME que contienen datos estructurados (JSON o payloads RSC de Next.js)
+DATA_MIME_TYPES = ('application/json', 'text/x-component', '+json')
+
+# Claves candidatas para cada campo, por orden de preferencia
+TITULO_KEYS = ('titulo', 'title', 'nombre', 'name')
+DESCRIPCION_KEYS = ('descripcion', 'description', 'resumen', 'summary', 'excerpt')
+ETIQUETAS_KEYS = ('etiquetas', 'tags', 'labels')
+FECHA_KEYS = ('fecha', 'date', 'publishedAt', 'published_at', 'createdAt', 'created_at')
+VISUALIZACIONES_KEYS = ('visualizaciones', 'views', 'viewCount', 'view_count', 'vistas')
+CATEGORIA_KEYS = ('categoria', 'category')
+DURACION_KEYS = ('duracion', 'duration')
+IMAGEN_KEYS = ('imagen', 'image', 'imageUrl', 'image_url', 'thumbnail', 'cover', 'portada')
+URL_KEYS = ('url', 'href', 'link', 'videoUrl', 'video_url', 'slug')
+PRECIO_KEYS = ('precio', 'price', 'amount', 'cost')
+MONEDA_KEYS = ('moneda', 'currency')
+PERIODO_KEYS = ('periodo', 'interval', 'period')
+CARACTERISTICAS_KEYS = ('caracteristicas', 'features', 'beneficios', 'benefits')
+
+# Mínimo de registros en una misma lista para aceptarlos; un objeto suelto
+# con forma de lección (p. ej. metadatos SEO/OpenGraph) no es un catálogo
+MIN_REGISTROS = 2
+
+# Prefijo de fila en el formato RSC: "<id>:<tipo opcional><datos>"
+RSC_ROW_PATTERN = re.compile(r'^([0-9a-zA-Z]+):([A-Z]{0,2})(.*)$')
+
+
+def enable_network_capture(chrome_options: Options) -> None:
+    """
+    Activa el registro de rendimiento de Chrome, que incluye los eventos de red.
+
+    Args:
+        chrome_options: Opciones de Chrome a modificar
+    """
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def capture_responses(driver: webdriver.Chrome) -> List[Dict[str, str]]:
+    """
+    Recupera el cuerpo de las respuestas de datos registradas por el navegador.
+
+    Solo se consideran las respuestas del mismo origen que la página, para
+    no confundir con datos del sitio las de servicios de terceros.
+
+    Args:
+        driver: Driver de Selenium con el registro de rendimiento activado
+
+    Returns:
+        Lista de respuestas con 'url', 'mime_type' y 'body'
+    """
+    responses = []
+    origen = urlparse(driver.current_url).netloc
+
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+
+        if message.get('method') != 'Network.responseReceived':
+            continue
+
+        params = message.get('params', {})
+        response = params.get('response', {})
+        mime_type = response.get('mimeType', '')
+        if not any(data_type in mime_type for data_type in DATA_MIME_TYPES):
+            continue
+        if urlparse(response.get('url', '')).netloc != origen:
+            continue
+
+        try:
+            result = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+        except Exception as e:
+            logger.debug(f"No se pudo leer la respuesta {response.get('url')}: {e}")
+            continue
+
+        body = result.get('body', '')
+        if result.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+
+        responses.append({'url': response.get('url', ''), 'mime_type': mime_type, 'body': body})
+
+    logger.info(f"Respuestas de datos capturadas: {len(responses)}")
+    return responses
+
+
+def parse_payload(body: str) -> List[Any]:
+    """
+    Decodifica el cuerpo de una respuesta JSON o RSC.
+
+    Args:
+        body: Cuerpo de la respuesta
+
+    Returns:
+        Lista de objetos decodificados (vacía si no hay datos válidos)
+    """
+    try:
+        return [json.loads(body)]
+    except ValueError:
+        pass
+
+    # Formato RSC: una fila por línea, cada una con su propio JSON
+    payloads = []
+    for line in body.splitlines():
+        match = RSC_ROW_PATTERN.match(line)
+        if not match:
+            continue
+        try:
+            payloads.append(json.loads(match.group(3)))
+        except ValueError:
+            continue
+
+    return payloads
+
+
+def find_records(obj: Any, is_match: Callable[[Dict[str, Any]], bool],
+                 min_registros: int = MIN_REGISTROS) -> List[Dict[str, Any]]:
+    """
+    Busca recursivamente listas de diccionarios que cumplen una condición.
+
+    Solo se aceptan los diccionarios que son elementos de una lista con al
+    menos `min_registros` coincidencias; los objetos sueltos se ignoran.
+
+    Args:
+        obj: Objeto JSON en el que buscar
+        is_match: Función que indica si un diccionario es un registro
+        min_registros: Mínimo de coincidencias en la misma lista
+
+    Returns:
+        Lista de registros encontrados, en orden de aparición
+    """
+    records = []
+    stack = [obj]
+
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            matches = [item for item in current if isinstance(item, dict) and is_match(item)]
+            if len(matches) >= min_registros:
+                records.extend(matches)
+                matched_ids = {id(item) for item in matches}
+                stack.extend(reversed([item for item in current if id(item) not in matched_ids]))
+            else:
+                stack.extend(reversed(current))
+
+    return records
+
+
+def _first_key(obj: Dict[str, Any], keys: tuple) -> Optional[str]:
+    """Retorna la primera clave de la lista presente con valor en el diccionario."""
+    for key in keys:
+        if obj.get(key) not in (None, '', [], {}):
+            return key
+    return None
+
+
+def _text(value: Any) -> str:
+    """Convierte un valor JSON (texto, número u objeto con nombre) a texto."""
+    if isinstance(value, dict):
+        key = _first_key(value, TITULO_KEYS + ('label', 'url', 'src', 'value'))
+        return _text(value[key]) if key else ""
+    if isinstance(value, list):
+        return ', '.join(filter(None, (_text(item) for item in value)))
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _text_list(value: Any) -> List[str]:
+    """Convierte un valor JSON a una lista de textos."""
+    if isinstance(value, list):
+        return [text for text in (_text(item) for item in value) if text]
+    text = _text(value)
+    return [text] if text else []
+
+
+def _field(obj: Dict[str, Any], keys: tuple, default: str = "") -> str:
+    """Retorna el texto del primer campo disponible entre las claves dadas."""
+    key = _first_key(obj, keys)
+    return _text(obj[key]) if key else default
+
+
+def _precio(obj: Dict[str, Any]) -> tuple[str, Dict[str, Any]]:
+    """
+    Resuelve el importe de un plan, que puede venir anidado en un objeto.
+
+    Args:
+        obj: Registro de plan o de precio
+
+    Returns:
+        Tupla con (importe en texto, objeto de precio anidado o {})
+    """
+    key = _first_key(obj, PRECIO_KEYS + ('value',))
+    if not key:
+        return "", {}
+
+    value = obj[key]
+    if isinstance(value, dict):
+        importe, _ = _precio(value)
+        return importe, value
+    return _text(value), {}
+
+
+def is_leccion(obj: Dict[str, Any]) -> bool:
+    """Indica si un diccionario tiene la forma de una lección."""
+    return (
+        _first_key(obj, TITULO_KEYS) is not None
+        and _first_key(obj, URL_KEYS) is not None
+        and _first_key(obj, DESCRIPCION_KEYS + IMAGEN_KEYS + FECHA_KEYS + DURACION_KEYS) is not None
+    )
+
+
+def is_plan(obj: Dict[str, Any]) -> bool:
+    """Indica si un diccionario tiene la forma de un plan de precios."""
+    return (
+        _first_key(obj, TITULO_KEYS) is not None
+        and _first_key(obj, PRECIO_KEYS) is not None
+        and _precio(obj)[0] != ""
+    )
+
+
+def map_leccion(obj: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+    """
+    Convierte un registro de la API en una lección con el formato del scraper.
+
+    Args:
+        obj: Registro de lección en el payload
+        base_url: URL de la página de lecciones, para resolver rutas relativas
+
+    Returns:
+        Diccionario con los campos de la lección (sin imagen descargada)
+    """
+    url_key = _first_key(obj, URL_KEYS)
+    video_url = _text(obj[url_key])
+    if url_key == 'slug' and '/' not in video_url:
+        video_url = f"{base_url.rstrip('/')}/{video_url}"
+    else:
+        video_url = urljoin(base_url, video_url)
+
+    etiquetas_key = _first_key(obj, ETIQUETAS_KEYS)
+    etiquetas = _text_list(obj[etiquetas_key]) if etiquetas_key else []
+
+    imagen_url = _field(obj, IMAGEN_KEYS)
+    if imagen_url:
+        imagen_url = urljoin(base_url, imagen_url)
+
+    return {
+        'titulo': _field(obj, TITULO_KEYS),
+        'descripcion': _field(obj, DESCRIPCION_KEYS),
+        'etiquetas': etiquetas,
+        'fecha': _field(obj, FECHA_KEYS, "No especificada"),
+        'visualizaciones': _field(obj, VISUALIZACIONES_KEYS, "0"),
+        'categoria': _field(obj, CATEGORIA_KEYS) or (etiquetas[0] if etiquetas else "General"),
+        'duracion': _field(obj, DURACION_KEYS),
+        'imagen_portada': "",
+        'imagen_url': imagen_url,
+        'url_video': video_url
+    }
+
+
+def map_plan(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convierte un registro de la API en un plan con el formato del scraper.
+
+    Args:
+        obj: Registro de plan en el payload
+
+    Returns:
+        Diccionario con los campos del plan
+    """
+    importe, precio_obj = _precio(obj)
+    precio = importe or "No especificado"
+    moneda = _field(obj, MONEDA_KEYS) or _field(precio_obj, MONEDA_KEYS)
+    periodo = _field(obj, PERIODO_KEYS) or _field(precio_obj, PERIODO_KEYS)
+    if moneda:
+        precio = f"{precio} {moneda}"
+    if periodo:
+        precio = f"{precio}/{periodo}"
+
+    caracteristicas_key = _first_key(obj, CARACTERISTICAS_KEYS)
+    caracteristicas = _text_list(obj[caracteristicas_key]) if caracteristicas_key else []
+
+    return {
+        'nombre': _field(obj, TITULO_KEYS),
+        'precio': precio,
+        'caracteristicas': caracteristicas,
+        'num_caracteristicas': len(caracteristicas)
+    }
+
+
+def extract_lecciones(responses: List[Dict[str, str]], base_url: str) -> List[Dict[str, Any]]:
+    """
+    Extrae las lecciones de las respuestas capturadas.
+
+    Args:
+        responses: Respuestas devueltas por capture_responses
+        base_url: URL de la página de lecciones
+
+    Returns:
+        Lista de lecciones sin duplicados, en orden de aparición
+    """
+    lecciones = {}
+    for response in responses:
+        for payload in parse_payload(response['body']):
+            for record in find_records(payload, is_leccion):
+                leccion = map_leccion(record, base_url)
+                lecciones.setdefault(leccion['url_video'], leccion)
+
+    return list(lecciones.values())
+
+
+def extract_planes(responses: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Extrae los planes de precios de las respuestas capturadas.
+
+    Args:
+        responses: Respuestas devueltas por capture_responses
+
+    Returns:
+        Lista de planes sin duplicados, en orden de aparición
+    """
+    planes = {}
+    for response in responses:
+        for payload in parse_payload(response['body']):
+            for record in find_records(payload, is_plan):
+                plan = map_plan(record)
+                planes.setdefault(plan['nombre'], plan)
+
+    return list(planes.values())
@@ -0,0 +1,241 @@
+"""Perfilado de CPU y memoria por etapas del scraping."""
+
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Profiler:
+    """
+    Perfila una ejecución separando el coste por etapas.
+
+    Cada etapa tiene su propio cProfile (las etapas anidadas pausan a la
+    etapa padre), un muestreador de pila en tiempo real genera las pilas
+    colapsadas para flame graphs y tracemalloc mide la memoria de cada etapa.
+    """
+
+    def __init__(self, top_n: int = 25, intervalo_muestreo: float = 0.005, profundidad: int = 25):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            top_n: Número de entradas en los rankings de funciones y asignaciones
+            intervalo_muestreo: Segundos entre muestras de la pila
+            profundidad: Número de frames guardados por asignación en tracemalloc
+        """
+        self.top_n = top_n
+        self.intervalo_muestreo = intervalo_muestreo
+        self.profundidad = profundidad
+        self._perfiles: Dict[str, cProfile.Profile] = {}
+        self._estadisticas: Dict[str, Dict[str, Any]] = {}
+        self._pila: List[Dict[str, Any]] = []
+        self._muestras: Counter = Counter()
+        self._snapshot_inicial = None
+        self._hilo = None
+        self._hilo_objetivo = None
+        self._detener = threading.Event()
+
+    def start(self) -> None:
+        """Inicia tracemalloc y el muestreo de pila del hilo actual."""
+        tracemalloc.start(self.profundidad)
+        self._snapshot_inicial = self._take_snapshot()
+        self._hilo_objetivo = threading.get_ident()
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._muestrear, name='profiler-muestreo', daemon=True)
+        self._hilo.start()
+        logger.info("Perfilado de CPU y memoria activado")
+
+    def _take_snapshot(self) -> tracemalloc.Snapshot:
+        """Toma un snapshot de tracemalloc sin las asignaciones del propio perfilador."""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def _muestrear(self) -> None:
+        """Registra periódicamente la pila del hilo perfilado."""
+        while not self._detener.wait(self.intervalo_muestreo):
+            frame = sys._current_frames().get(self._hilo_objetivo)
+            if frame is None:
+                continue
+
+            pila = []
+            while frame is not None:
+                code = frame.f_code
+                # Sin espacios: el formato colapsado separa la cuenta con uno
+                frame_label = f"{code.co_name}[{os.path.basename(code.co_filename)}:{code.co_firstlineno}]"
+                pila.append(frame_label.replace(' ', '_'))
+                frame = frame.f_back
+            pila.reverse()
+
+            etapas = [f"etapa:{entrada['nombre']}" for entrada in list(self._pila)] or ["etapa:ninguna"]
+            self._muestras[';'.join(etapas + pila)] += 1
+
+    @contextmanager
+    def etapa(self, nombre: str):
+        """
+        Perfila el bloque como parte de una etapa.
+
+        Una etapa puede ejecutarse varias veces (p. ej. una por descarga);
+        sus mediciones se acumulan.
+
+        Args:
+            nombre: Nombre de la etapa
+        """
+        padre = self._pila[-1] if self._pila else None
+        actual, pico_previo = tracemalloc.get_traced_memory()
+        if padre:
+            self._perfiles[padre['nombre']].disable()
+            padre['pico'] = max(padre['pico'], pico_previo)
+        tracemalloc.reset_peak()
+
+        entrada = {'nombre': nombre, 'pico': 0}
+        self._pila.append(entrada)
+        perfil = self._perfiles.setdefault(nombre, cProfile.Profile())
+        inicio = time.perf_counter()
+        perfil.enable()
+
+        try:
+            yield
+        finally:
+            perfil.disable()
+            duracion = time.perf_counter() - inicio
+            final, pico = tracemalloc.get_traced_memory()
+            self._pila.pop()
+
+            stats = self._estadisticas.setdefault(
+                nombre, {'llamadas': 0, 'tiempo': 0.0, 'memoria_neta': 0, 'pico': 0})
+            stats['llamadas'] += 1
+            stats['tiempo'] += duracion
+            stats['memoria_neta'] += final - actual
+            stats['pico'] = max(stats['pico'], entrada['pico'], pico)
+
+            if padre:
+                padre['pico'] = max(padre['pico'], entrada['pico'], pico)
+                self._perfiles[padre['nombre']].enable()
+
+    def stop(self, output_dir: Path) -> Dict[str, Path]:
+        """
+        Detiene el perfilado y escribe los resultados.
+
+        Args:
+            output_dir: Directorio donde guardar los archivos
+
+        Returns:
+            Diccionario con las rutas generadas
+        """
+        self._detener.set()
+        if self._hilo:
+            self._hilo.join()
+
+        snapshot = self._take_snapshot()
+        tracemalloc.stop()
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        prefix = Path(output_dir) / f'perfil_{timestamp}'
+        paths = {
+            'pstats': prefix.with_suffix('.pstats'),
+            'collapsed': prefix.with_suffix('.collapsed'),
+            'informe': Path(f'{prefix}_informe.txt'),
+        }
+
+        # pstats combinado y uno por etapa
+        combinado = None
+        for nombre, perfil in self._perfiles.items():
+            stats = pstats.Stats(perfil)
+            stats.dump_stats(f'{prefix}_{nombre}.pstats')
+            if combinado is None:
+                combinado = pstats.Stats(perfil)
+            else:
+                combinado.add(perfil)
+        if combinado is not None:
+            combinado.dump_stats(paths['pstats'])
+
+        # Pilas colapsadas (formato de flamegraph.pl / speedscope)
+        with open(paths['collapsed'], 'w', encoding='utf-8') as f:
+            for pila, cuenta in self._muestras.most_common():
+                f.write(f"{pila} {cuenta}\n")
+
+        with open(paths['informe'], 'w', encoding='utf-8') as f:
+            f.write(self._generate_report(snapshot))
+
+        for path in paths.values():
+            logger.info(f"Perfil guardado: {path}")
+
+        return paths
+
+    def _generate_report(self, snapshot: tracemalloc.Snapshot) -> str:
+        """
+        Genera el informe de etapas, funciones y asignaciones de memoria.
+
+        Args:
+            snapshot: Snapshot final de tracemalloc
+
+        Returns:
+            String con el informe formateado
+        """
+        report = []
+        report.append("=" * 60)
+        report.append("INFORME DE PERFILADO")
+        report.append("=" * 60)
+        report.append("")
+
+        report.append("--- ETAPAS ---")
+        report.append("(tiempo real inclusivo; memoria según tracemalloc)")
+        for nombre, stats in self._estadisticas.items():
+            report.append(f"\n  {nombre}")
+            report.append(f"  Ejecuciones: {stats['llamadas']}")
+            report.append(f"  Tiempo: {stats['tiempo']:.3f} s")
+            report.append(f"  Memoria neta: {stats['memoria_neta'] / 1024:.1f} KiB")
+            report.append(f"  Pico de memoria: {stats['pico'] / 1024:.1f} KiB")
+        report.append("")
+
+        report.append(f"--- TOP {self.top_n} FUNCIONES POR ETAPA (tiempo acumulado) ---")
+        report.append("(excluye el tiempo de las etapas anidadas)")
+        for nombre, perfil in self._perfiles.items():
+            stats = pstats.Stats(perfil).sort_stats(pstats.SortKey.CUMULATIVE)
+            report.append(f"\n  {nombre}")
+            for func in stats.fcn_list[:self.top_n]:
+                _, ncalls, _, cumtime, _ = stats.stats[func]
+                filename, lineno, funcname = func
+                report.append(f"  {cumtime:9.3f} s  {ncalls:7d}  {funcname} ({os.path.basename(filename)}:{lineno})")
+        report.append("")
+
+        report.append(f"--- TOP {self.top_n} ASIGNACIONES VIVAS AL FINAL ---")
+        for stat in snapshot.statistics('lineno')[:self.top_n]:
+            frame = stat.traceback[0]
+            report.append(f"  {stat.size / 1024:9.1f} KiB  {stat.count:7d}  {frame.filename}:{frame.lineno}")
+        report.append("")
+
+        report.append(f"--- TOP {self.top_n} CRECIMIENTOS DESDE EL INICIO ---")
+        for stat in snapshot.compare_to(self._snapshot_inicial, 'lineno')[:self.top_n]:
+            frame = stat.traceback[0]
+            report.append(f"  {stat.size_diff / 1024:+9.1f} KiB  {stat.count_diff:+7d}  {frame.filename}:{frame.lineno}")
+        report.append("")
+
+        report.append("=" * 60)
+
+        return "\n".join(report)
+
+
+def etapa(profiler: Optional[Profiler], nombre: str):
+    """
+    Retorna el contexto de perfilado de una etapa, o uno vacío sin perfilador.
+
+    Args:
+        profiler: Perfilador activo o None
+        nombre: Nombre de la etapa
+    """
+    return profiler.etapa(nombre) if profiler else nullcontext()
@@ -2,8 +2,9 @@
 
 import logging
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from pathlib import Path
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -11,6 +12,9 @@ from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 import time
 from src.utils import download_image
+from src.checkpoint import Checkpoint
+from src.network import enable_network_capture, capture_responses, extract_lecciones
+from src.profiling import Profiler, etapa
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +22,20 @@ logger = logging.getLogger(__name__)
 class LeccionesScraper:
     """Scraper para extraer información de lecciones."""
 
-    def __init__(self, url: str = "https://codeia.dev/lecciones"):
+    def __init__(self, url: str = "https://codeia.dev/lecciones", modo: str = "dom",
+                 profiler: Optional[Profiler] = None):
         """
         Inicializa el scraper de lecciones.
 
         Args:
             url: URL de la página de lecciones
+            modo: 'dom' para parsear el HTML renderizado o 'red' para extraer
+                los datos de las respuestas de red (con el HTML como respaldo)
+            profiler: Perfilador donde registrar las etapas del scraping
         """
         self.url = url
+        self.modo = modo
+        self.profiler = profiler
         self.driver = None
 
     def setup_driver(self) -> webdriver.Chrome:
@@ -38,6 +48,9 @@ class LeccionesScraper:
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
 
+        if self.modo == 'red':
+            enable_network_capture(chrome_options)
+
         # Ruta específica de Chrome en macOS
         chrome_options.binary_location = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
 
@@ -81,12 +94,117 @@ class LeccionesScraper:
         # Limitar longitud
         return text[:max_length]
 
-    def scrape(self, images_path: Path) -> tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+    def parse_items(self, soup: BeautifulSoup, errors: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Extrae las lecciones del HTML renderizado.
+
+        Args:
+            soup: HTML de la página de lecciones
+            errors: Lista donde añadir los errores de cada elemento
+
+        Returns:
+            Lista de lecciones (sin imagen descargada)
+        """
+        lecciones = []
+
+        # Buscar enlaces principales que contienen las lecciones (basado en el HTML proporcionado)
+        leccion_items = soup.find_all('a', class_='block group', href=True)
+
+        logger.info(f"Elementos de lecciones encontrados: {len(leccion_items)}")
+
+        for idx, item in enumerate(leccion_items, 1):
+            try:
+                # Extraer URL del video (desde el href del enlace principal)
+                href = item.get('href', '')
+                video_url = urljoin(self.url, href)
+
+                # Extraer título (h3 con font-semibold)
+                titulo_elem = item.find('h3', class_=lambda x: x and 'font-semibold' in str(x))
+                titulo = titulo_elem.get_text(strip=True) if titulo_elem else f"Lección {idx}"
+
+                # Extraer descripción (p con text-muted-foreground)
+                descripcion_elem = item.find('p', class_=lambda x: x and 'text-muted-foreground' in str(x) and 'line-clamp' in str(x))
+                descripcion = descripcion_elem.get_text(strip=True) if descripcion_elem else ""
+
+                # Extraer todas las etiquetas (badges)
+                etiquetas = []
+                badge_containers = item.find_all('div', class_=lambda x: x and 'inline-flex' in str(x) and 'rounded-full' in str(x))
+
+                for badge in badge_containers:
+                    badge_text = badge.get_text(strip=True)
+                    # Filtrar badges vacíos o con solo iconos
+                    if badge_text and len(badge_text) > 1 and not badge_text.startswith('<?'):
+                        etiquetas.append(badge_text)
+
+                # Extraer categoría (primer badge con estilo de color de fondo)
+                categoria = "General"
+                first_badge = item.find('div', class_=lambda x: x and 'inline-flex' in str(x) and 'rounded-full' in str(x))
+                if first_badge:
+                    categoria = first_badge.get_text(strip=True)
+
+                # Extraer fecha (span con icono de calendario)
+                fecha = "No especificada"
+                fecha_container = item.find('svg', class_=lambda x: x and 'lucide-calendar' in str(x))
+                if fecha_container:
+                    fecha_span = fecha_container.find_next('span')
+                    if fecha_span:
+                        fecha = fecha_span.get_text(strip=True)
+
+                # Extraer visualizaciones (span con icono de usuarios)
+                visualizaciones = "0"
+                users_icon = item.find('svg', class_=lambda x: x and 'lucide-users' in str(x))
+                if users_icon:
+                    views_span = users_icon.find_next('span')
+                    if views_span:
+                        visualizaciones = views_span.get_text(strip=True)
+
+                # Extraer duración del video
+                duracion = ""
+                duracion_elem = item.find('div', class_=lambda x: x and 'absolute' in str(x) and 'bottom-2' in str(x))
+                if duracion_elem:
+                    duracion = duracion_elem.get_text(strip=True)
+
+                # Extraer URL de la imagen de portada
+                imagen_url = ""
+                img_elem = item.find('img')
+                if img_elem:
+                    imagen_url = img_elem.get('src', '') or img_elem.get('data-src', '')
+                    if imagen_url:
+                        imagen_url = urljoin(self.url, imagen_url)
+
+                lecciones.append({
+                    'titulo': titulo,
+                    'descripcion': descripcion,
+                    'etiquetas': etiquetas,
+                    'fecha': fecha,
+                    'visualizaciones': visualizaciones,
+                    'categoria': categoria,
+                    'duracion': duracion,
+                    'imagen_portada': "",
+                    'imagen_url': imagen_url,
+                    'url_video': video_url
+                })
+
+            except Exception as e:
+                error_msg = f"Error al procesar lección {idx}: {str(e)}"
+                logger.error(error_msg)
+                errors.append({
+                    'tipo': 'leccion_item',
+                    'mensaje': error_msg,
+                    'url': self.url
+                })
+
+        return lecciones
+
+    def scrape(self, images_path: Path,
+               checkpoint: Optional[Checkpoint] = None) -> tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
         """
         Extrae los datos de lecciones de la página.
 
         Args:
             images_path: Ruta donde guardar las imágenes
+            checkpoint: Diario donde registrar el progreso y consultar el
+                trabajo ya completado en una ejecución anterior
 
         Returns:
             Tupla con (datos_extraídos, errores)
@@ -96,117 +214,87 @@ class LeccionesScraper:
 
         try:
             logger.info(f"Iniciando scraping de lecciones: {self.url}")
-            self.driver = self.setup_driver()
-            self.driver.get(self.url)
-
-            # Esperar a que la página cargue
-            time.sleep(4)
-
-            # Scroll para cargar contenido dinámico
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-
-            # Buscar enlaces principales que contienen las lecciones (basado en el HTML proporcionado)
-            leccion_items = soup.find_all('a', class_='block group', href=True)
-
-            logger.info(f"Elementos de lecciones encontrados: {len(leccion_items)}")
-
-            for idx, item in enumerate(leccion_items, 1):
-                try:
-                    # Extraer URL del video (desde el href del enlace principal)
-                    href = item.get('href', '')
-                    video_url = f"https://codeia.dev{href}" if href.startswith('/') else href
-
-                    # Extraer título (h3 con font-semibold)
-                    titulo_elem = item.find('h3', class_=lambda x: x and 'font-semibold' in str(x))
-                    titulo = titulo_elem.get_text(strip=True) if titulo_elem else f"Lección {idx}"
-
-                    # Extraer descripción (p con text-muted-foreground)
-                    descripcion_elem = item.find('p', class_=lambda x: x and 'text-muted-foreground' in str(x) and 'line-clamp' in str(x))
-                    descripcion = descripcion_elem.get_text(strip=True) if descripcion_elem else ""
-
-                    # Extraer todas las etiquetas (badges)
-                    etiquetas = []
-                    badge_containers = item.find_all('div', class_=lambda x: x and 'inline-flex' in str(x) and 'rounded-full' in str(x))
-
-                    for badge in badge_containers:
-                        badge_text = badge.get_text(strip=True)
-                        # Filtrar badges vacíos o con solo iconos
-                        if badge_text and len(badge_text) > 1 and not badge_text.startswith('<?'):
-                            etiquetas.append(badge_text)
-
-                    # Extraer categoría (primer badge con estilo de color de fondo)
-                    categoria = "General"
-                    first_badge = item.find('div', class_=lambda x: x and 'inline-flex' in str(x) and 'rounded-full' in str(x))
-                    if first_badge:
-                        categoria = first_badge.get_text(strip=True)
-
-                    # Extraer fecha (span con icono de calendario)
-                    fecha = "No especificada"
-                    fecha_container = item.find('svg', class_=lambda x: x and 'lucide-calendar' in str(x))
-                    if fecha_container:
-                        fecha_span = fecha_container.find_next('span')
-                        if fecha_span:
-                            fecha = fecha_span.get_text(strip=True)
-
-                    # Extraer visualizaciones (span con icono de usuarios)
-                    visualizaciones = "0"
-                    users_icon = item.find('svg', class_=lambda x: x and 'lucide-users' in str(x))
-                    if users_icon:
-                        views_span = users_icon.find_next('span')
-                        if views_span:
-                            visualizaciones = views_span.get_text(strip=True)
-
-                    # Extraer duración del video
-                    duracion = ""
-                    duracion_elem = item.find('div', class_=lambda x: x and 'absolute' in str(x) and 'bottom-2' in str(x))
-                    if duracion_elem:
-                        duracion = duracion_elem.get_text(strip=True)
-
-                    # Extraer imagen de portada
-                    imagen_url = ""
-                    imagen_filename = ""
-                    img_elem = item.find('img')
-
-                    if img_elem:
-                        imagen_url = img_elem.get('src', '') or img_elem.get('data-src', '')
-
-                        if imagen_url:
-                            # Descargar imagen
-                            filename_base = self.normalize_filename(titulo)
-                            download_result = download_image(imagen_url, images_path, filename_base)
+            with etapa(self.profiler, 'driver'):
+                self.driver = self.setup_driver()
+
+            with etapa(self.profiler, 'carga_pagina'):
+                self.driver.get(self.url)
+
+                # Esperar a que la página cargue
+                time.sleep(4)
+
+                # Scroll para cargar contenido dinámico
+                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(2)
+
+            lecciones = []
+            if self.modo == 'red':
+                with etapa(self.profiler, 'captura_red'):
+                    responses = capture_responses(self.driver)
+                with etapa(self.profiler, 'extraccion'):
+                    lecciones = extract_lecciones(responses, self.url)
+                if lecciones:
+                    logger.info(f"Lecciones encontradas en respuestas de red: {len(lecciones)}")
+                else:
+                    logger.warning("No se encontraron lecciones en las respuestas de red, usando el HTML")
+
+            if not lecciones:
+                with etapa(self.profiler, 'parse'):
+                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                with etapa(self.profiler, 'extraccion'):
+                    lecciones = self.parse_items(soup, errors)
+
+            with etapa(self.profiler, 'extraccion'):
+                for idx, leccion in enumerate(lecciones, 1):
+                    try:
+                        # La URL puede repetirse (p. ej. href="#"), así que se combina con el título
+                        clave = f"{leccion['url_video']}|{leccion['titulo']}"
+
+                        # Reutilizar la lección si ya se completó antes de una interrupción
+                        if checkpoint:
+                            leccion_previa = checkpoint.leccion_completada(clave)
+                            if leccion_previa:
+                                lecciones_data.append(leccion_previa)
+                                logger.info(f"Lección recuperada del checkpoint: {leccion_previa.get('titulo')}")
+                                continue
+
+                        # Descargar imagen de portada
+                        imagen_url = leccion['imagen_url']
+                        imagen_filename = ""
+                        descarga_fallida = False
+
+                        if imagen_url and checkpoint:
+                            imagen_filename = checkpoint.descarga_completada(imagen_url, images_path) or ""
+
+                        if imagen_url and not imagen_filename:
+                            filename_base = self.normalize_filename(leccion['titulo'])
+                            with etapa(self.profiler, 'descargas'):
+                                download_result = download_image(imagen_url, images_path, filename_base)
 
                             if download_result['success']:
                                 imagen_filename = download_result['filename']
+                                if checkpoint:
+                                    checkpoint.marcar_descarga(imagen_url, imagen_filename)
                             else:
                                 errors.append(download_result)
-
-                    leccion = {
-                        'titulo': titulo,
-                        'descripcion': descripcion,
-                        'etiquetas': etiquetas,
-                        'fecha': fecha,
-                        'visualizaciones': visualizaciones,
-                        'categoria': categoria,
-                        'duracion': duracion,
-                        'imagen_portada': imagen_filename,
-                        'imagen_url': imagen_url,
-                        'url_video': video_url
-                    }
-
-                    lecciones_data.append(leccion)
-                    logger.info(f"Lección extraída: {titulo}")
-
-                except Exception as e:
-                    error_msg = f"Error al procesar lección {idx}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append({
-                        'tipo': 'leccion_item',
-                        'mensaje': error_msg,
-                        'url': self.url
-                    })
+                                descarga_fallida = True
+
+                        leccion['imagen_portada'] = imagen_filename
+
+                        lecciones_data.append(leccion)
+                        # Si la imagen falló, no se registra para reintentarla con --resume
+                        if checkpoint and not descarga_fallida:
+                            checkpoint.marcar_leccion(clave, leccion)
+                        logger.info(f"Lección extraída: {leccion['titulo']}")
+
+                    except Exception as e:
+                        error_msg = f"Error al procesar lección {idx}: {str(e)}"
+                        logger.error(error_msg)
+                        errors.append({
+                            'tipo': 'leccion_item',
+                            'mensaje': error_msg,
+                            'url': self.url
+                        })
 
         except Exception as e:
             error_msg = f"Error al scrapear lecciones: {str(e)}"
@@ -1,7 +1,7 @@
 """Scraper para la página de precios de codeia.dev"""
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -11,6 +11,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+from src.network import enable_network_capture, capture_responses, extract_planes
+from src.profiling import Profiler, etapa
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +20,20 @@ logger = logging.getLogger(__name__)
 class PreciosScraper:
     """Scraper para extraer información de precios."""
 
-    def __init__(self, url: str = "https://codeia.dev/precios"):
+    def __init__(self, url: str = "https://codeia.dev/precios", modo: str = "dom",
+                 profiler: Optional[Profiler] = None):
         """
         Inicializa el scraper de precios.
 
         Args:
             url: URL de la página de precios
+            modo: 'dom' para parsear el HTML renderizado o 'red' para extraer
+                los datos de las respuestas de red (con el HTML como respaldo)
+            profiler: Perfilador donde registrar las etapas del scraping
         """
         self.url = url
+        self.modo = modo
+        self.profiler = profiler
         self.driver = None
 
     def setup_driver(self) -> webdriver.Chrome:
@@ -38,6 +46,9 @@ class PreciosScraper:
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
 
+        if self.modo == 'red':
+            enable_network_capture(chrome_options)
+
         # Ruta específica de Chrome en macOS
         chrome_options.binary_location = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
 
@@ -61,86 +72,121 @@ class PreciosScraper:
 
         return driver
 
-    def scrape(self) -> tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+    def parse_cards(self, soup: BeautifulSoup, errors: List[Dict[str, str]]) -> List[Dict[str, Any]]:
         """
-        Extrae los datos de precios de la página.
+        Extrae los planes de precios del HTML renderizado.
+
+        Args:
+            soup: HTML de la página de precios
+            errors: Lista donde añadir los errores de cada card
 
         Returns:
-            Tupla con (datos_extraídos, errores)
+            Lista de planes
         """
-        precios_data = []
-        errors = []
+        planes = []
 
-        try:
-            logger.info(f"Iniciando scraping de precios: {self.url}")
-            self.driver = self.setup_driver()
-            self.driver.get(self.url)
+        # Buscar cards de precios (ajustar selectores según la estructura real)
+        pricing_cards = soup.find_all(['div', 'section'], class_=lambda x: x and any(
+            term in str(x).lower() for term in ['price', 'pricing', 'plan', 'card']))
 
-            # Esperar a que la página cargue
-            time.sleep(3)
+        if not pricing_cards:
+            # Intento alternativo: buscar por estructura común
+            pricing_cards = soup.find_all('div', class_=lambda x: x and 'card' in str(x).lower())
 
-            # Intentar encontrar elementos de precios
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        logger.info(f"Elementos de precios encontrados: {len(pricing_cards)}")
 
-            # Buscar cards de precios (ajustar selectores según la estructura real)
-            pricing_cards = soup.find_all(['div', 'section'], class_=lambda x: x and any(
-                term in str(x).lower() for term in ['price', 'pricing', 'plan', 'card']))
+        for idx, card in enumerate(pricing_cards, 1):
+            try:
+                # Extraer nombre del plan
+                nombre_elem = card.find(['h1', 'h2', 'h3', 'h4'], class_=lambda x: x and any(
+                    term in str(x).lower() for term in ['title', 'name', 'heading']))
 
-            if not pricing_cards:
-                # Intento alternativo: buscar por estructura común
-                pricing_cards = soup.find_all('div', class_=lambda x: x and 'card' in str(x).lower())
+                if not nombre_elem:
+                    nombre_elem = card.find(['h1', 'h2', 'h3', 'h4'])
 
-            logger.info(f"Elementos de precios encontrados: {len(pricing_cards)}")
+                nombre = nombre_elem.get_text(strip=True) if nombre_elem else f"Plan {idx}"
 
-            for idx, card in enumerate(pricing_cards, 1):
-                try:
-                    # Extraer nombre del plan
-                    nombre_elem = card.find(['h1', 'h2', 'h3', 'h4'], class_=lambda x: x and any(
-                        term in str(x).lower() for term in ['title', 'name', 'heading']))
+                # Extraer precio
+                precio_elem = card.find(['span', 'div', 'p'], class_=lambda x: x and any(
+                    term in str(x).lower() for term in ['price', 'cost', 'amount']))
 
-                    if not nombre_elem:
-                        nombre_elem = card.find(['h1', 'h2', 'h3', 'h4'])
+                if not precio_elem:
+                    precio_elem = card.find(string=lambda text: text and ('$' in text or '€' in text or 'USD' in text))
 
-                    nombre = nombre_elem.get_text(strip=True) if nombre_elem else f"Plan {idx}"
+                precio = precio_elem.get_text(strip=True) if precio_elem else "No especificado"
 
-                    # Extraer precio
-                    precio_elem = card.find(['span', 'div', 'p'], class_=lambda x: x and any(
-                        term in str(x).lower() for term in ['price', 'cost', 'amount']))
+                # Extraer características
+                caracteristicas = []
+                features_list = card.find_all(['li', 'p'], class_=lambda x: x and 'feature' in str(x).lower())
 
-                    if not precio_elem:
-                        precio_elem = card.find(string=lambda text: text and ('$' in text or '€' in text or 'USD' in text))
+                if not features_list:
+                    features_list = card.find_all('li')
 
-                    precio = precio_elem.get_text(strip=True) if precio_elem else "No especificado"
+                for feature in features_list:
+                    text = feature.get_text(strip=True)
+                    if text and len(text) > 3:
+                        caracteristicas.append(text)
 
-                    # Extraer características
-                    caracteristicas = []
-                    features_list = card.find_all(['li', 'p'], class_=lambda x: x and 'feature' in str(x).lower())
+                planes.append({
+                    'nombre': nombre,
+                    'precio': precio,
+                    'caracteristicas': caracteristicas,
+                    'num_caracteristicas': len(caracteristicas)
+                })
 
-                    if not features_list:
-                        features_list = card.find_all('li')
+                logger.info(f"Plan extraído: {nombre}")
 
-                    for feature in features_list:
-                        text = feature.get_text(strip=True)
-                        if text and len(text) > 3:
-                            caracteristicas.append(text)
+            except Exception as e:
+                error_msg = f"Error al procesar card de precio {idx}: {str(e)}"
+                logger.error(error_msg)
+                errors.append({
+                    'tipo': 'precio_card',
+                    'mensaje': error_msg,
+                    'url': self.url
+                })
 
-                    precios_data.append({
-                        'nombre': nombre,
-                        'precio': precio,
-                        'caracteristicas': caracteristicas,
-                        'num_caracteristicas': len(caracteristicas)
-                    })
+        return planes
 
-                    logger.info(f"Plan extraído: {nombre}")
+    def scrape(self) -> tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+        """
+        Extrae los datos de precios de la página.
+
+        Returns:
+            Tupla con (datos_extraídos, errores)
+        """
+        precios_data = []
+        errors = []
 
-                except Exception as e:
-                    error_msg = f"Error al procesar card de precio {idx}: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append({
-                        'tipo': 'precio_card',
-                        'mensaje': error_msg,
-                        'url': self.url
-                    })
+        try:
+            logger.info(f"Iniciando scraping de precios: {self.url}")
+            with etapa(self.profiler, 'driver'):
+                self.driver = self.setup_driver()
+
+            with etapa(self.profiler, 'carga_pagina'):
+                self.driver.get(self.url)
+
+                # Esperar a que la página cargue
+                time.sleep(3)
+
+            if self.modo == 'red':
+                with etapa(self.profiler, 'captura_red'):
+                    responses = capture_responses(self.driver)
+                with etapa(self.profiler, 'extraccion'):
+                    precios_data = extract_planes(responses)
+                if precios_data:
+                    logger.info(f"Planes encontrados en respuestas de red: {len(precios_data)}")
+                    for plan in precios_data:
+                        logger.info(f"Plan extraído: {plan['nombre']}")
+                else:
+                    logger.warning("No se encontraron planes en las respuestas de red, usando el HTML")
+
+            if not precios_data:
+                with etapa(self.profiler, 'parse'):
+                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+
+                # Intentar encontrar elementos de precios
+                with etapa(self.profiler, 'extraccion'):
+                    precios_data = self.parse_cards(soup, errors)
 
         except Exception as e:
             error_msg = f"Error al scrapear precios: {str(e)}"
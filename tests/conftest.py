@@ -0,0 +1,80 @@
+"""Fixtures compartidas por los tests."""
+
+import json
+import re
+import urllib.request
+from urllib.parse import urljoin
+
+import pytest
+
+from tests.stand_in_server import StandInServer
+
+FETCH_PATTERN = re.compile(r"fetch\('([^']+)'\)")
+
+
+class FakeDriver:
+    """
+    Sustituto de webdriver.Chrome para los tests, sin navegador.
+
+    Al cargar una página descarga el HTML y los endpoints que ésta pide con
+    `fetch`, y los expone igual que Chrome: como eventos
+    Network.responseReceived en el registro 'performance' y mediante
+    Network.getResponseBody.
+    """
+
+    def __init__(self):
+        self.page_source = ""
+        self.current_url = ""
+        self._log = []
+        self._bodies = {}
+
+    def _fetch(self, url: str) -> str:
+        with urllib.request.urlopen(url) as response:
+            body = response.read().decode('utf-8', errors='replace')
+            mime_type = response.headers.get_content_type()
+
+        request_id = str(len(self._bodies) + 1)
+        self._bodies[request_id] = body
+        self._log.append({'message': json.dumps({'message': {
+            'method': 'Network.responseReceived',
+            'params': {'requestId': request_id, 'response': {'url': url, 'mimeType': mime_type}},
+        }})})
+        return body
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+        self.page_source = self._fetch(url)
+        for endpoint in FETCH_PATTERN.findall(self.page_source):
+            try:
+                self._fetch(urljoin(url, endpoint))
+            except OSError:
+                pass
+
+    def get_log(self, log_type: str) -> list:
+        log, self._log = self._log, []
+        return log
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        return {'body': self._bodies[params['requestId']], 'base64Encoded': False}
+
+    def execute_script(self, script: str) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    """Servidor local con las páginas y endpoints por defecto."""
+    with StandInServer() as srv:
+        yield srv
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    """Hace que los scrapers usen FakeDriver y no esperen entre pasos."""
+    monkeypatch.setattr('src.scraper_lecciones.LeccionesScraper.setup_driver', lambda self: FakeDriver())
+    monkeypatch.setattr('src.scraper_precios.PreciosScraper.setup_driver', lambda self: FakeDriver())
+    monkeypatch.setattr('src.scraper_lecciones.time.sleep', lambda seconds: None)
+    monkeypatch.setattr('src.scraper_precios.time.sleep', lambda seconds: None)
@@ -0,0 +1,86 @@
+"""Servidor local que imita codeia.dev para probar la extracción.
+
+Sirve las páginas `/lecciones` y `/precios` (con el HTML que entiende el
+parser del DOM) y los endpoints de datos que esas páginas cargan con
+`fetch`. Se puede usar desde los tests o a mano:
+
+    python -m tests.stand_in_server 8000
+    python main.py --extraccion red --base-url http://localhost:8000
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+# Ruta -> (archivo en fixtures/, content-type)
+DEFAULT_ROUTES = {
+    '/lecciones': ('lecciones.html', 'text/html; charset=utf-8'),
+    '/precios': ('precios.html', 'text/html; charset=utf-8'),
+    '/api/lecciones': ('lecciones.json', 'application/json'),
+    '/api/precios': ('precios.rsc', 'text/x-component'),
+    '/img/intro-ia.png': ('intro-ia.png', 'image/png'),
+}
+
+
+class StandInServer:
+    """Servidor HTTP en un hilo, utilizable como context manager."""
+
+    def __init__(self, routes: Optional[Dict[str, Tuple[str, str]]] = None, port: int = 0):
+        """
+        Inicializa el servidor.
+
+        Args:
+            routes: Rutas que sustituyen o amplían DEFAULT_ROUTES (None da 404)
+            port: Puerto de escucha (0 para uno libre)
+        """
+        self.routes = {**DEFAULT_ROUTES, **(routes or {})}
+        routes_map = self.routes
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                route = routes_map.get(self.path.split('?')[0])
+                if route is None:
+                    self.send_error(404)
+                    return
+
+                filename, content_type = route
+                body = (FIXTURES / filename).read_bytes()
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """URL base del servidor."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> 'StandInServer':
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
+    server = StandInServer(port=port)
+    print(f"Sirviendo en {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
@@ -0,0 +1,206 @@
+"""Tests del diario de checkpoints y de la reanudación con --resume."""
+
+import json
+
+import pytest
+
+from src.checkpoint import Checkpoint
+from src.scraper_lecciones import LeccionesScraper
+from tests.stand_in_server import StandInServer
+
+OPCIONES = {'base_url': 'http://localhost:8000', 'extraccion': 'dom'}
+
+
+def test_resume_ignora_linea_truncada_y_la_cierra(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    checkpoint = Checkpoint(path, opciones=OPCIONES)
+    checkpoint.marcar_leccion('a', {'titulo': 'A'})
+    checkpoint.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"tipo": "leccion", "cla')
+
+    checkpoint = Checkpoint(path, resume=True, opciones=OPCIONES)
+    assert checkpoint.leccion_completada('a') == {'titulo': 'A'}
+    checkpoint.marcar_leccion('b', {'titulo': 'B'})
+    checkpoint.close()
+
+    checkpoint = Checkpoint(path, resume=True, opciones=OPCIONES)
+    assert checkpoint.leccion_completada('a') == {'titulo': 'A'}
+    assert checkpoint.leccion_completada('b') == {'titulo': 'B'}
+    checkpoint.close()
+
+
+def test_sin_resume_se_reinicia(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    checkpoint = Checkpoint(path, opciones=OPCIONES)
+    checkpoint.marcar_etapa('precios', [], [])
+    checkpoint.close()
+
+    checkpoint = Checkpoint(path, opciones=OPCIONES)
+    assert checkpoint.etapa_completada('precios') is None
+    checkpoint.close()
+
+
+def test_lo_registrado_en_la_ejecucion_no_se_reutiliza(tmp_path):
+    (tmp_path / 'a.png').write_bytes(b'x')
+    checkpoint = Checkpoint(tmp_path / 'checkpoint.jsonl', opciones=OPCIONES)
+
+    checkpoint.marcar_leccion('a', {'titulo': 'A'})
+    checkpoint.marcar_descarga('http://x/a.png', 'a.png')
+
+    assert checkpoint.leccion_completada('a') is None
+    assert checkpoint.descarga_completada('http://x/a.png', tmp_path) is None
+    checkpoint.close()
+
+
+def test_descarga_completada_exige_el_archivo(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    (tmp_path / 'a.png').write_bytes(b'x')
+    checkpoint = Checkpoint(path, opciones=OPCIONES)
+    checkpoint.marcar_descarga('http://x/a.png', 'a.png')
+    checkpoint.close()
+
+    checkpoint = Checkpoint(path, resume=True, opciones=OPCIONES)
+    assert checkpoint.descarga_completada('http://x/a.png', tmp_path) == 'a.png'
+    (tmp_path / 'a.png').unlink()
+    assert checkpoint.descarga_completada('http://x/a.png', tmp_path) is None
+    checkpoint.close()
+
+
+def test_resume_con_otras_opciones_empieza_de_cero(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    checkpoint = Checkpoint(path, opciones=OPCIONES)
+    checkpoint.marcar_etapa('precios', [{'nombre': 'Pro'}], [])
+    checkpoint.close()
+
+    checkpoint = Checkpoint(path, resume=True, opciones={**OPCIONES, 'base_url': 'http://otro'})
+    assert checkpoint.etapa_completada('precios') is None
+    checkpoint.close()
+
+    cabecera = json.loads(path.read_text(encoding='utf-8').splitlines()[0])
+    assert cabecera == {'tipo': 'cabecera', 'opciones': {**OPCIONES, 'base_url': 'http://otro'}}
+
+
+def test_clear_elimina_el_diario(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    checkpoint = Checkpoint(path, opciones=OPCIONES)
+    checkpoint.clear()
+
+    assert not path.exists()
+
+
+def test_urls_repetidas_sin_resume_no_se_mezclan(fake_browser, tmp_path):
+    with StandInServer({'/lecciones': ('duplicados.html', 'text/html; charset=utf-8')}) as server:
+        checkpoint = Checkpoint(tmp_path / 'checkpoint.jsonl', opciones=OPCIONES)
+        scraper = LeccionesScraper(f"{server.base_url}/lecciones")
+        lecciones, _ = scraper.scrape(tmp_path, checkpoint)
+        checkpoint.close()
+
+    assert [leccion['titulo'] for leccion in lecciones] == ['A', 'B']
+
+
+@pytest.fixture
+def run_main(monkeypatch, tmp_path, fake_browser):
+    """Ejecuta main.main en un directorio temporal contra un servidor local."""
+    monkeypatch.chdir(tmp_path)
+    import main
+
+    def run(server, *args):
+        return main.main(['--extraccion', 'red', '--base-url', server.base_url, *args])
+
+    return run
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Registra las URLs de imágenes descargadas."""
+    from src import scraper_lecciones
+
+    urls = []
+    download_image = scraper_lecciones.download_image
+
+    def recording_download(url, *args):
+        urls.append(url)
+        return download_image(url, *args)
+
+    monkeypatch.setattr(scraper_lecciones, 'download_image', recording_download)
+    return urls
+
+
+@pytest.fixture
+def precios_drivers(monkeypatch):
+    """Cuenta los drivers creados por el scraper de precios."""
+    from src.scraper_precios import PreciosScraper
+
+    drivers = []
+    setup_driver = PreciosScraper.setup_driver
+    monkeypatch.setattr(PreciosScraper, 'setup_driver',
+                        lambda self: drivers.append(1) or setup_driver(self))
+    return drivers
+
+
+def read_output(tmp_path, filename):
+    return json.loads((tmp_path / 'output' / 'data' / filename).read_text(encoding='utf-8'))
+
+
+def test_error_de_etapa_conserva_el_diario_y_resume_recupera_la_terminada(
+        run_main, monkeypatch, precios_drivers, tmp_path):
+    original_setup = LeccionesScraper.setup_driver
+
+    def chrome_caido(self):
+        raise RuntimeError("Chrome ha muerto")
+
+    with StandInServer() as server:
+        monkeypatch.setattr(LeccionesScraper, 'setup_driver', chrome_caido)
+        run_main(server)
+        assert (tmp_path / 'output' / 'checkpoint.jsonl').exists()
+
+        monkeypatch.setattr(LeccionesScraper, 'setup_driver', original_setup)
+        run_main(server, '--resume')
+
+    assert len(precios_drivers) == 1
+    assert [plan['nombre'] for plan in read_output(tmp_path, 'precios.json')] == ['Pro', 'Free']
+    assert len(read_output(tmp_path, 'lecciones.json')) == 2
+    assert not (tmp_path / 'output' / 'checkpoint.jsonl').exists()
+
+
+def test_resume_tras_interrupcion_no_repite_descargas(run_main, monkeypatch, downloads, tmp_path):
+    marcar_leccion = Checkpoint.marcar_leccion
+
+    def marcar_e_interrumpir(self, clave, datos):
+        marcar_leccion(self, clave, datos)
+        raise KeyboardInterrupt
+
+    with StandInServer() as server:
+        monkeypatch.setattr(Checkpoint, 'marcar_leccion', marcar_e_interrumpir)
+        with pytest.raises(KeyboardInterrupt):
+            run_main(server)
+        assert len(downloads) == 1
+        assert (tmp_path / 'output' / 'checkpoint.jsonl').exists()
+
+        monkeypatch.setattr(Checkpoint, 'marcar_leccion', marcar_leccion)
+        downloads.clear()
+        run_main(server, '--resume')
+
+    assert downloads == []
+    lecciones = read_output(tmp_path, 'lecciones.json')
+    assert [leccion['titulo'] for leccion in lecciones] == ['Introducción a IA', 'Agentes']
+    assert lecciones[0]['imagen_portada'] == 'introducción-a-ia.png'
+    assert not (tmp_path / 'output' / 'checkpoint.jsonl').exists()
+
+
+def test_descarga_fallida_se_reintenta_con_resume(run_main, downloads, precios_drivers, tmp_path):
+    with StandInServer({'/img/intro-ia.png': None}) as server:
+        run_main(server)
+        assert (tmp_path / 'output' / 'checkpoint.jsonl').exists()
+        assert read_output(tmp_path, 'lecciones.json')[0]['imagen_portada'] == ''
+
+        # La imagen vuelve a estar disponible
+        server.routes['/img/intro-ia.png'] = ('intro-ia.png', 'image/png')
+        downloads.clear()
+        run_main(server, '--resume')
+
+    assert downloads == [f"{server.base_url}/img/intro-ia.png"]
+    assert len(precios_drivers) == 1
+    assert read_output(tmp_path, 'lecciones.json')[0]['imagen_portada'] == 'introducción-a-ia.png'
+    assert not (tmp_path / 'output' / 'checkpoint.jsonl').exists()
@@ -0,0 +1,57 @@
+"""Tests de los scrapers contra el servidor local, en modo red y DOM."""
+
+from src.scraper_lecciones import LeccionesScraper
+from src.scraper_precios import PreciosScraper
+from tests.stand_in_server import StandInServer
+
+
+def test_lecciones_modo_red_usa_el_json(server, fake_browser, tmp_path):
+    scraper = LeccionesScraper(f"{server.base_url}/lecciones", modo='red')
+
+    lecciones, errors = scraper.scrape(tmp_path)
+
+    assert errors == []
+    assert [leccion['titulo'] for leccion in lecciones] == ['Introducción a IA', 'Agentes']
+    assert lecciones[0]['url_video'] == f"{server.base_url}/lecciones/intro-ia"
+    assert lecciones[0]['imagen_portada'] == 'introducción-a-ia.png'
+    assert (tmp_path / 'introducción-a-ia.png').exists()
+
+
+def test_lecciones_modo_red_vuelve_al_html_sin_datos(fake_browser, tmp_path):
+    with StandInServer({'/api/lecciones': ('vacio.json', 'application/json')}) as server:
+        scraper = LeccionesScraper(f"{server.base_url}/lecciones", modo='red')
+        lecciones, errors = scraper.scrape(tmp_path)
+
+    assert errors == []
+    assert [leccion['titulo'] for leccion in lecciones] == ['Introducción a IA (HTML)', 'Agentes (HTML)']
+    assert lecciones[0]['url_video'] == f"{server.base_url}/lecciones/intro-ia"
+    assert lecciones[0]['etiquetas'] == ['IA', 'Python']
+    assert lecciones[0]['fecha'] == '15 ene 2024'
+    assert lecciones[0]['imagen_portada'] == 'introducción-a-ia-html.png'
+
+
+def test_lecciones_modo_dom_ignora_la_red(server, fake_browser, tmp_path):
+    scraper = LeccionesScraper(f"{server.base_url}/lecciones", modo='dom')
+
+    lecciones, _ = scraper.scrape(tmp_path)
+
+    assert lecciones[0]['titulo'] == 'Introducción a IA (HTML)'
+
+
+def test_precios_modo_red_usa_el_rsc(server, fake_browser):
+    scraper = PreciosScraper(f"{server.base_url}/precios", modo='red')
+
+    planes, errors = scraper.scrape()
+
+    assert errors == []
+    assert [(plan['nombre'], plan['precio']) for plan in planes] == [('Pro', '19 EUR/mes'), ('Free', '0')]
+
+
+def test_precios_modo_red_vuelve_al_html_sin_datos(fake_browser):
+    with StandInServer({'/api/precios': ('vacio.json', 'application/json')}) as server:
+        scraper = PreciosScraper(f"{server.base_url}/precios", modo='red')
+        planes, errors = scraper.scrape()
+
+    assert errors == []
+    assert planes[0]['nombre'] == 'Pro (HTML)'
+    assert planes[0]['caracteristicas'] == ['Todas las lecciones', 'Soporte prioritario']
@@ -0,0 +1,146 @@
+"""Tests de la extracción de datos desde respuestas de red."""
+
+import json
+
+from src.network import (
+    capture_responses,
+    parse_payload,
+    find_records,
+    is_leccion,
+    is_plan,
+    map_leccion,
+    map_plan,
+    extract_lecciones,
+    extract_planes,
+)
+from tests.conftest import FakeDriver
+from tests.stand_in_server import FIXTURES, StandInServer
+
+BASE_URL = "http://localhost:8000/lecciones"
+
+
+def response(filename):
+    return {'url': f'http://localhost:8000/{filename}', 'body': (FIXTURES / filename).read_text(encoding='utf-8')}
+
+
+def test_capture_responses_solo_datos_del_mismo_origen():
+    with StandInServer() as terceros, StandInServer() as server:
+        driver = FakeDriver()
+        driver.get(f"{server.base_url}/lecciones")
+        driver._fetch(f"{terceros.base_url}/api/lecciones")
+        driver._fetch(f"{server.base_url}/img/intro-ia.png")
+
+        responses = capture_responses(driver)
+
+    assert [r['url'] for r in responses] == [f"{server.base_url}/api/lecciones"]
+
+
+def test_parse_payload_json():
+    assert parse_payload('{"a": [1, 2]}') == [{'a': [1, 2]}]
+
+
+def test_parse_payload_rsc_ignora_filas_no_json():
+    payloads = parse_payload(response('precios.rsc')['body'])
+
+    assert payloads[0] == ["$", "main", None, {"children": "$L1"}]
+    assert payloads[1] == ["app/precios/page.js", ["chunk-1"], "default"]
+    assert payloads[2]['plans'][0]['name'] == 'Pro'
+
+
+def test_parse_payload_invalido():
+    assert parse_payload('<html></html>') == []
+
+
+def test_find_records_en_orden_y_sin_descender_en_coincidencias():
+    data = {'a': [{'id': 1, 'hijos': [{'id': 2}, {'id': 3}]}, {'id': 4}, {'x': [{'id': 5}, {'id': 6}]}]}
+
+    records = find_records(data, lambda obj: 'id' in obj)
+
+    assert [record['id'] for record in records] == [1, 4, 5, 6]
+
+
+def test_find_records_ignora_objetos_sueltos():
+    data = {'meta': {'id': 1}, 'items': [{'id': 2}], 'otros': [{'id': 3}, {'x': 0}]}
+
+    assert find_records(data, lambda obj: 'id' in obj) == []
+
+
+def test_is_leccion_descarta_enlaces_de_navegacion():
+    assert is_leccion({'title': 'Agentes', 'href': '/lecciones/agentes', 'description': 'x'})
+    assert not is_leccion({'title': 'Inicio', 'href': '/'})
+
+
+def test_is_plan_exige_precio_con_importe():
+    assert is_plan({'name': 'Pro', 'price': 19})
+    assert is_plan({'name': 'Free', 'price': 0})
+    assert is_plan({'name': 'Pro', 'price': {'amount': 19}})
+    assert not is_plan({'name': 'Pro', 'price': {'label': 'Consultar'}})
+    assert not is_plan({'name': 'Pro'})
+
+
+def test_map_leccion_resuelve_slug_y_objetos_anidados():
+    leccion = map_leccion({
+        'title': 'Intro',
+        'slug': 'intro-ia',
+        'tags': [{'name': 'IA'}, 'Python'],
+        'thumbnail': {'url': '/img/intro.png'},
+        'views': 10,
+    }, BASE_URL)
+
+    assert leccion['url_video'] == 'http://localhost:8000/lecciones/intro-ia'
+    assert leccion['imagen_url'] == 'http://localhost:8000/img/intro.png'
+    assert leccion['etiquetas'] == ['IA', 'Python']
+    assert leccion['categoria'] == 'IA'
+    assert leccion['visualizaciones'] == '10'
+    assert leccion['fecha'] == 'No especificada'
+    assert leccion['imagen_portada'] == ''
+
+
+def test_map_plan_precio_anidado():
+    plan = map_plan({'name': 'Pro', 'price': {'amount': 19}, 'currency': 'EUR', 'interval': 'month'})
+    assert plan['precio'] == '19 EUR/month'
+
+    plan = map_plan({'name': 'Pro', 'price': {'amount': 19, 'currency': 'EUR', 'interval': 'month'}})
+    assert plan['precio'] == '19 EUR/month'
+
+
+def test_extract_lecciones_json():
+    lecciones = extract_lecciones([response('lecciones.json')], BASE_URL)
+
+    assert [leccion['titulo'] for leccion in lecciones] == ['Introducción a IA', 'Agentes']
+    assert lecciones[1]['url_video'] == 'http://localhost:8000/lecciones/agentes'
+    assert lecciones[1]['categoria'] == 'Avanzado'
+
+
+def test_extract_lecciones_sin_duplicados():
+    body = json.dumps([{'title': 'A', 'slug': 'a', 'description': 'x'}] * 2)
+
+    assert len(extract_lecciones([{'url': '', 'body': body}], BASE_URL)) == 1
+
+
+def test_extract_planes_rsc():
+    planes = extract_planes([response('precios.rsc')])
+
+    assert planes == [
+        {
+            'nombre': 'Pro',
+            'precio': '19 EUR/mes',
+            'caracteristicas': ['Todas las lecciones', 'Soporte prioritario'],
+            'num_caracteristicas': 2,
+        },
+        {'nombre': 'Free', 'precio': '0', 'caracteristicas': [], 'num_caracteristicas': 0},
+    ]
+
+
+def test_extract_lecciones_ignora_metadatos_seo():
+    body = json.dumps({
+        'seo': {'title': 'Lecciones | CodeIA', 'url': 'https://codeia.dev/lecciones', 'description': 'Aprende IA'},
+        'openGraph': [{'title': 'CodeIA', 'url': 'https://codeia.dev', 'description': 'Cursos', 'image': '/og.png'}],
+    })
+
+    assert extract_lecciones([{'url': '', 'body': body}], BASE_URL) == []
+
+
+def test_extract_sin_datos():
+    assert extract_lecciones([response('vacio.json')], BASE_URL) == []
+    assert extract_planes([response('vacio.json')]) == []
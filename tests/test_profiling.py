@@ -0,0 +1,53 @@
+"""Tests del perfilador por etapas."""
+
+import pstats
+import re
+import time
+
+from src.profiling import Profiler, etapa
+
+COLLAPSED_LINE = re.compile(r'^etapa:[^ ]+(;[^ ]+)* \d+$')
+
+
+def descargar():
+    datos = [str(i) for i in range(20000)]
+    time.sleep(0.03)
+    return datos
+
+
+def test_etapas_anidadas_generan_pstats_pilas_e_informe(tmp_path):
+    profiler = Profiler(top_n=5, intervalo_muestreo=0.002)
+    profiler.start()
+
+    resultados = []
+    with etapa(profiler, 'extraccion'):
+        for _ in range(3):
+            with etapa(profiler, 'descargas'):
+                resultados.append(descargar())
+
+    paths = profiler.stop(tmp_path)
+
+    # pstats combinado y por etapa; la etapa padre se pausa durante las anidadas
+    combinado = pstats.Stats(str(paths['pstats']))
+    extraccion = pstats.Stats(str(tmp_path / f"{paths['pstats'].stem}_extraccion.pstats"))
+    descargas = pstats.Stats(str(tmp_path / f"{paths['pstats'].stem}_descargas.pstats"))
+    funciones = lambda stats: {func[2] for func in stats.stats}
+    assert 'descargar' in funciones(descargas)
+    assert 'descargar' not in funciones(extraccion)
+    assert 'descargar' in funciones(combinado)
+
+    # Pilas colapsadas
+    lines = paths['collapsed'].read_text(encoding='utf-8').splitlines()
+    assert lines
+    assert all(COLLAPSED_LINE.match(line) for line in lines), lines
+    assert any(line.startswith('etapa:extraccion;etapa:descargas;') for line in lines)
+
+    # Informe con las ejecuciones acumuladas de cada etapa
+    report = paths['informe'].read_text(encoding='utf-8')
+    assert re.search(r'\n  extraccion\n  Ejecuciones: 1\n', report)
+    assert re.search(r'\n  descargas\n  Ejecuciones: 3\n', report)
+
+
+def test_etapa_sin_perfilador_no_hace_nada():
+    with etapa(None, 'extraccion'):
+        pass